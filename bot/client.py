@@ -113,3 +113,63 @@ class BinanceFuturesClient:
         except Exception as e:
              logger.error(f"Unexpected error: {e}", exc_info=True)
              raise NetworkError(f"System failure: {e}")
+
+    def _send_batch(self, batch: list) -> list:
+        """
+        Places one batch. Unlike _retry_request, only failures where the exchange did not
+        run the orders (429 rate limit, -1021 timestamp) are retried: re-sending after a
+        network error or 5xx could duplicate live orders.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self.client.futures_place_batch_order(batchOrders=batch)
+            except BinanceAPIException as e:
+                attempt += 1
+                if attempt >= Config.RETRY_COUNT or not (e.code == -1021 or e.status_code == 429):
+                    raise
+
+                if e.code == -1021:
+                    logger.warning("Timestamp error, resyncing...", extra={"event": "retry_sync"})
+                    self._sync_time()
+                sleep_time = Config.RETRY_DELAY * (2 ** (attempt - 1))
+                logger.warning(
+                    f"API Error {e}. Retrying batch {attempt}/{Config.RETRY_COUNT} in {sleep_time}s...",
+                    extra={"event": "retry_attempt", "error": str(e)}
+                )
+                time.sleep(sleep_time)
+
+    def create_batch_orders(self, params_list: list) -> list:
+        """
+        Sends orders through the batchOrders endpoint in chunks of Config.BATCH_ORDER_SIZE.
+        Returns one raw result per order, in input order, so already-placed orders are never lost:
+        - exchange rejections come back as {"code": ..., "msg": ...} entries;
+        - a chunk whose outcome is unknown (network failure or 5xx) is marked
+          {"status": "UNKNOWN", ...} and may be live on the exchange, reconcile it by newClientOrderId;
+        - the chunks after an unknown one are not sent and are marked {"status": "NOT_SENT", ...}.
+        """
+        results = []
+        for start in range(0, len(params_list), Config.BATCH_ORDER_SIZE):
+            batch = params_list[start:start + Config.BATCH_ORDER_SIZE]
+            try:
+                logger.info("Sending batch order request", extra={"event": "batch_order_request", "count": len(batch)})
+                response = self._send_batch(batch)
+                logger.info("Batch order sent", extra={"event": "batch_order_success", "count": len(response)})
+                results.extend(response)
+                continue
+            except BinanceAPIException as e:
+                 logger.error(f"Binance API Error: {e}", exc_info=True, extra={"event": "batch_order_error", "code": e.code})
+                 if e.status_code < 500:
+                     results.extend({"code": e.code, "msg": e.message} for _ in batch)
+                     continue
+                 # Server-side failure: the chunk may or may not have been executed
+                 code, reason = e.code, e.message
+            except Exception as e:
+                 logger.error(f"Unexpected error: {e}", exc_info=True, extra={"event": "batch_order_error"})
+                 code, reason = None, str(e)
+
+            results.extend({"status": "UNKNOWN", "code": code, "msg": f"Status unknown: {reason}"} for _ in batch)
+            not_sent = len(params_list) - start - len(batch)
+            results.extend({"status": "NOT_SENT", "code": None, "msg": f"Not sent: {reason}"} for _ in range(not_sent))
+            break
+        return results
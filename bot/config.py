@@ -18,6 +18,7 @@ class Config:
     TIMEOUT = 10  # Seconds for API requests
     RETRY_COUNT = 3
     RETRY_DELAY = 1  # Base retry delay (exponential backoff)
+    BATCH_ORDER_SIZE = 5  # Max orders per futures batchOrders request
     
     @classmethod
     def validate(cls):
@@ -0,0 +1,119 @@
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP
+from typing import List
+from .exceptions import ValidationError
+from .precision import round_to_increment
+from .schemas import GridLevel, GridPlan
+from .validators import OrderValidator
+import logging
+
+logger = logging.getLogger("trading_bot")
+
+def _raw_prices(lower: Decimal, upper: Decimal, levels: int, spacing: str) -> List[Decimal]:
+    """Unrounded level prices from lower to upper (both ends included)."""
+    prices = [lower]
+    if spacing == "ARITHMETIC":
+        step = (upper - lower) / (levels - 1)
+        prices.extend(lower + step * i for i in range(1, levels - 1))
+    else:
+        ratio = (upper / lower) ** (Decimal(1) / (levels - 1))
+        price = lower
+        for _ in range(1, levels - 1):
+            price *= ratio
+            prices.append(price)
+    # Pin the top level to the input instead of accumulating drift
+    prices.append(upper)
+    return prices
+
+def build_grid(
+    symbol: str,
+    side: str,
+    lower: Decimal,
+    upper: Decimal,
+    levels: int,
+    total_quantity: Decimal,
+    tick_size: Decimal,
+    step_size: Decimal,
+    min_qty: Decimal = Decimal("0"),
+    min_notional: Decimal = Decimal("0"),
+    spacing: str = "ARITHMETIC"
+) -> GridPlan:
+    """
+    Generates every child order of a ladder in a single pass.
+
+    The ladder never leaves [lower, upper]: the bounds are rounded inward to the
+    tick (lower up, upper down), interior levels are rounded HALF_UP and clamped
+    to them, and levels that collapse onto the same tick are merged.
+
+    total_quantity is split in whole step_size units; the leftover units go one
+    each to the levels nearest the market (highest price for BUY, lowest for
+    SELL). Dust below one step is reported as unallocated. Every level must meet
+    min_qty and, since all prices are known, min_notional.
+    """
+    OrderValidator.validate_grid(lower, upper, levels, total_quantity, spacing)
+
+    # Bounds are risk limits: round them inward so no level falls outside
+    floor_price = round_to_increment(lower, tick_size, ROUND_CEILING)
+    ceiling_price = round_to_increment(upper, tick_size, ROUND_FLOOR)
+    if floor_price > ceiling_price:
+        raise ValidationError(f"Price range {lower} - {upper} contains no valid tick (tick {tick_size}).")
+
+    # Round and drop levels collapsed by tick rounding (rounding is monotonic,
+    # so duplicates are always adjacent)
+    prices: List[Decimal] = []
+    for raw in _raw_prices(lower, upper, levels, spacing):
+        price = round_to_increment(raw, tick_size, ROUND_HALF_UP)
+        price = min(max(price, floor_price), ceiling_price)
+        if not prices or price != prices[-1]:
+            prices.append(price)
+
+    if len(prices) < 2:
+        raise ValidationError(
+            f"Price range {lower} - {upper} collapses to {len(prices)} level(s) with tick {tick_size}. "
+            f"Grid needs at least 2 distinct levels."
+        )
+
+    if len(prices) < levels:
+        logger.warning(
+            f"Grid collapsed {levels - len(prices)} duplicate levels after tick rounding",
+            extra={"event": "grid_levels_collapsed", "symbol": symbol}
+        )
+
+    if side == "BUY":
+        prices.reverse()
+
+    # Quantity distribution in integer step units
+    count = len(prices)
+    if step_size > 0:
+        units = (total_quantity / step_size).to_integral_value(rounding=ROUND_DOWN)
+        base_units, extra_units = divmod(int(units), count)
+        base_qty = base_units * step_size
+        quantities = [base_qty + step_size if i < extra_units else base_qty for i in range(count)]
+        unallocated = total_quantity - units * step_size
+    else:
+        base_qty = total_quantity / count
+        quantities = [base_qty] * count
+        unallocated = total_quantity - base_qty * count
+
+    if base_qty <= 0 or base_qty < min_qty:
+        raise ValidationError(
+            f"Total quantity {total_quantity} is too small for {count} levels "
+            f"(per-level {base_qty}, minimum {min_qty})."
+        )
+
+    # Smallest order value: lowest price at the base (non-remainder) quantity
+    min_value = base_qty * min(prices)
+    if min_value < min_notional:
+        raise ValidationError(
+            f"Total quantity {total_quantity} is too small for {count} levels "
+            f"(smallest level notional {min_value}, minimum {min_notional})."
+        )
+
+    return GridPlan(
+        symbol=symbol,
+        side=side,
+        spacing=spacing,
+        levels=[GridLevel(price=p, quantity=q) for p, q in zip(prices, quantities)],
+        requested_levels=levels,
+        total_quantity=total_quantity,
+        unallocated_qty=unallocated
+    )
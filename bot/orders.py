@@ -5,11 +5,16 @@ from .validators import OrderValidator
 from .precision import round_step_size, round_tick_size
 from .validators import ValidationError, PrecisionError
 from .exceptions import APIRequestError, NetworkError
-from .schemas import OrderResponse
+from .grid import build_grid
+from .schemas import OrderResponse, GridPlan, GridSubmission
 import logging
+import uuid
 
 logger = logging.getLogger("trading_bot")
 
+# Reply when a newClientOrderId already exists, i.e. an earlier attempt was placed
+DUPLICATE_CLIENT_ORDER_ID = -4116
+
 class OrderManager:
     """Orchestrates order placement, validation, and execution."""
     
@@ -118,6 +123,100 @@ class OrderManager:
         raw_response = self.client.create_order(api_params)
         
         # 3. Response Normalization
+        return self._to_order_response(raw_response)
+
+    def plan_grid(self, symbol: str, side: str, lower: float, upper: float, levels: int,
+                  total_quantity: float, spacing: str = "ARITHMETIC") -> GridPlan:
+        """
+        Builds a LIMIT ladder between lower and upper, normalized against the symbol's
+        filters once for the whole grid.
+        """
+        lower_dec = Decimal(str(lower))
+        upper_dec = Decimal(str(upper))
+        total_dec = Decimal(str(total_quantity))
+
+        # Basic pre-check before fetching metadata
+        OrderValidator.validate_symbol(symbol)
+        OrderValidator.validate_side(side)
+        OrderValidator.validate_grid(lower_dec, upper_dec, levels, total_dec, spacing)
+
+        symbol_info = self._get_symbol_info(symbol)
+        lot_size = self._get_filter(symbol_info, 'LOT_SIZE')
+        price_filter = self._get_filter(symbol_info, 'PRICE_FILTER')
+        # Futures MIN_NOTIONAL uses 'notional'; grid prices are all known, so it can be checked up front
+        min_notional = self._get_filter(symbol_info, 'MIN_NOTIONAL')
+
+        plan = build_grid(
+            symbol=symbol,
+            side=side,
+            lower=lower_dec,
+            upper=upper_dec,
+            levels=levels,
+            total_quantity=total_dec,
+            tick_size=Decimal(price_filter.get('tickSize', '0')),
+            step_size=Decimal(lot_size.get('stepSize', '0')),
+            min_qty=Decimal(lot_size.get('minQty', '0')),
+            min_notional=Decimal(min_notional.get('notional', '0')),
+            spacing=spacing
+        )
+        logger.info(
+            f"Grid planned: {symbol} {side} {len(plan.levels)} levels {lower}-{upper} ({spacing})",
+            extra={"event": "grid_planned", "collapsed": plan.collapsed_levels}
+        )
+        return plan
+
+    def place_grid(self, plan: GridPlan) -> GridSubmission:
+        """
+        Submits a planned grid through batched requests.
+        """
+        params_list = plan.to_params()
+
+        # Deterministic client ids let orders with an unknown outcome be reconciled
+        grid_id = uuid.uuid4().hex[:12]
+        for i, params in enumerate(params_list):
+            params["newClientOrderId"] = f"grid-{grid_id}-{i}"
+
+        raw_results = self.client.create_batch_orders(params_list)
+        if len(raw_results) != len(params_list):
+            logger.error(
+                f"Batch returned {len(raw_results)} results for {len(params_list)} orders",
+                extra={"event": "grid_result_mismatch", "symbol": plan.symbol}
+            )
+            # Orders without a result may still be live
+            missing = len(params_list) - len(raw_results)
+            raw_results = raw_results[:len(params_list)] + [
+                {"status": "UNKNOWN", "code": None, "msg": "Status unknown: no result returned"}
+            ] * max(missing, 0)
+
+        submission = GridSubmission()
+        for params, raw in zip(params_list, raw_results):
+            if 'orderId' in raw:
+                submission.accepted.append(self._to_order_response(raw))
+                continue
+
+            entry = {
+                "price": params["price"],
+                "quantity": params["quantity"],
+                "client_order_id": params["newClientOrderId"],
+                "code": raw.get('code'),
+                "msg": raw.get('msg')
+            }
+            if raw.get('status') == 'UNKNOWN' or raw.get('code') == DUPLICATE_CLIENT_ORDER_ID:
+                submission.unknown.append(entry)
+            elif raw.get('status') == 'NOT_SENT':
+                submission.not_sent.append(entry)
+            else:
+                submission.rejected.append(entry)
+
+        logger.info(
+            f"Grid submitted: {len(submission.accepted)} accepted, {len(submission.rejected)} rejected, "
+            f"{len(submission.unknown)} unknown, {len(submission.not_sent)} not sent",
+            extra={"event": "grid_submitted", "symbol": plan.symbol}
+        )
+        return submission
+
+    def _to_order_response(self, raw_response: Dict) -> OrderResponse:
+        """Maps a raw exchange order payload to OrderResponse."""
         return OrderResponse(
             order_id=raw_response.get('orderId'),
             client_order_id=raw_response.get('clientOrderId'),
@@ -33,3 +33,17 @@ def round_tick_size(price: Decimal, tick_size: Decimal) -> Decimal:
         return price.quantize(Decimal(f"1e{precision}"), rounding=ROUND_HALF_UP)
     except Exception as e:
         raise PrecisionError(f"Failed to round price {price} with tick_size {tick_size}: {e}")
+
+def round_to_increment(value: Decimal, increment: Decimal, rounding: str = ROUND_DOWN) -> Decimal:
+    """
+    Rounds value to an exact multiple of increment (works for ticks like 0.5 or 10).
+    Example: value=45000.3, increment=0.5, rounding=ROUND_HALF_UP -> 45000.5
+    """
+    try:
+        if increment == 0:
+            return value
+
+        units = (value / increment).to_integral_value(rounding=rounding)
+        return units * increment
+    except Exception as e:
+        raise PrecisionError(f"Failed to round {value} to increment {increment}: {e}")
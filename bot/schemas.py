@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional
 
 @dataclass
 class OrderResponse:
@@ -27,3 +27,52 @@ class OrderResponse:
             "orig_qty": str(self.orig_qty),
             "status": self.status
         }
+
+@dataclass
+class GridLevel:
+    """A single child order of a grid/ladder."""
+    price: Decimal
+    quantity: Decimal
+
+    def to_params(self, symbol: str, side: str) -> dict:
+        return {
+            "symbol": symbol,
+            "side": side,
+            "type": "LIMIT",
+            "quantity": "{:f}".format(self.quantity.normalize()),
+            "price": "{:f}".format(self.price.normalize()),
+            "timeInForce": "GTC"
+        }
+
+@dataclass
+class GridPlan:
+    """Exchange-ready grid of LIMIT orders, ordered nearest-to-market first."""
+    symbol: str
+    side: str
+    spacing: str
+    levels: List[GridLevel]
+    requested_levels: int
+    total_quantity: Decimal
+    unallocated_qty: Decimal = Decimal("0")
+
+    @property
+    def collapsed_levels(self) -> int:
+        """Levels merged away because they rounded onto the same tick."""
+        return self.requested_levels - len(self.levels)
+
+    @property
+    def allocated_qty(self) -> Decimal:
+        return sum((level.quantity for level in self.levels), Decimal("0"))
+
+    def to_params(self) -> List[dict]:
+        return [level.to_params(self.symbol, self.side) for level in self.levels]
+
+@dataclass
+class GridSubmission:
+    """Outcome of a batched grid submission."""
+    accepted: List[OrderResponse] = field(default_factory=list)
+    rejected: List[Dict] = field(default_factory=list)
+    # Outcome not known (e.g. timeout mid-request); may be live, reconcile by client_order_id
+    unknown: List[Dict] = field(default_factory=list)
+    # Never sent to the exchange; safe to resubmit
+    not_sent: List[Dict] = field(default_factory=list)
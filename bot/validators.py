@@ -23,6 +23,20 @@ class OrderValidator:
         if order_type not in ["MARKET", "LIMIT"]:
             raise ValidationError(f"Invalid type: {order_type}. Must be MARKET or LIMIT.")
 
+    @staticmethod
+    def validate_grid(lower: Decimal, upper: Decimal, levels: int, total_quantity: Decimal, spacing: str) -> None:
+        """
+        Validates grid inputs that do not depend on exchange metadata.
+        """
+        if spacing not in ["ARITHMETIC", "GEOMETRIC"]:
+            raise ValidationError(f"Invalid spacing: {spacing}. Must be ARITHMETIC or GEOMETRIC.")
+        if levels < 2:
+            raise ValidationError(f"Grid needs at least 2 levels. Got: {levels}")
+        if lower <= 0 or upper <= lower:
+            raise ValidationError(f"Invalid price range: {lower} - {upper}. Need 0 < lower < upper.")
+        if total_quantity <= 0:
+            raise ValidationError(f"Total quantity must be positive. Got: {total_quantity}")
+
     @staticmethod
     def validate_quantity(quantity: Decimal, step_size: Decimal, min_qty: Decimal) -> None:
         """
@@ -8,13 +8,101 @@ from bot.orders import OrderManager
 from bot.logging_config import setup_logging
 from bot.exceptions import ValidationError, APIRequestError, NetworkError, PrecisionError
 
+GRID_PREVIEW_ROWS = 10
+
+def parse_grid_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="cli.py grid",
+        description="Place a ladder of LIMIT orders across a price range",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    parser.add_argument("--symbol", required=True, type=str, help="Trading pair (e.g., BTCUSDT)")
+    parser.add_argument("--side", required=True, type=str, choices=["BUY", "SELL"], help="Order side: BUY or SELL")
+    parser.add_argument("--lower", required=True, type=float, help="Lowest level price")
+    parser.add_argument("--upper", required=True, type=float, help="Highest level price")
+    parser.add_argument("--levels", required=True, type=int, help="Number of levels (before tick de-duplication)")
+    parser.add_argument("--total-quantity", required=True, type=float, help="Total quantity split across all levels")
+    parser.add_argument("--spacing", type=str, default="ARITHMETIC", choices=["ARITHMETIC", "GEOMETRIC"], help="Level spacing (default: ARITHMETIC)")
+    parser.add_argument("--yes", action="store_true", help="Skip confirmation prompt")
+
+    return parser.parse_args(argv)
+
+def run_grid(args):
+    manager = OrderManager()
+
+    plan = manager.plan_grid(
+        symbol=args.symbol,
+        side=args.side,
+        lower=args.lower,
+        upper=args.upper,
+        levels=args.levels,
+        total_quantity=args.total_quantity,
+        spacing=args.spacing
+    )
+
+    # Print Summary
+    print("\nGrid Summary")
+    print("=" * 30)
+    print(f"Symbol:   {plan.symbol}")
+    print(f"Side:     {plan.side}")
+    print(f"Spacing:  {plan.spacing}")
+    print(f"Levels:   {len(plan.levels)} (collapsed: {plan.collapsed_levels})")
+    print(f"Quantity: {plan.allocated_qty} (unallocated: {plan.unallocated_qty})")
+    print("-" * 30)
+    for level in plan.levels[:GRID_PREVIEW_ROWS]:
+        print(f"{level.price:>14}  x {level.quantity}")
+    if len(plan.levels) > GRID_PREVIEW_ROWS:
+        print(f"... {len(plan.levels) - GRID_PREVIEW_ROWS} more levels")
+    print("-" * 30)
+
+    if not args.yes:
+        confirm = input("Confirm grid? (y/n): ").strip().lower()
+        if confirm != 'y':
+            print("Grid cancelled by user.")
+            sys.exit(0)
+
+    print("\nSending grid to Binance Futures Testnet...")
+
+    submission = manager.place_grid(plan)
+
+    print("\nGrid Submitted")
+    print("=" * 30)
+    print(f"Accepted: {len(submission.accepted)}")
+    print(f"Rejected: {len(submission.rejected)}")
+    for rejection in submission.rejected:
+        print(f"  {rejection['price']} x {rejection['quantity']}: {rejection['msg']} (Code {rejection['code']})")
+    print(f"Unknown:  {len(submission.unknown)}")
+    for unknown in submission.unknown:
+        print(f"  {unknown['price']} x {unknown['quantity']}: {unknown['msg']} [clientOrderId {unknown['client_order_id']}]")
+    if submission.unknown:
+        print("Unknown orders may be live. Check them by clientOrderId before re-running the grid.")
+    print(f"Not sent: {len(submission.not_sent)}")
+    for skipped in submission.not_sent:
+        print(f"  {skipped['price']} x {skipped['quantity']}")
+    if submission.not_sent:
+        print("Not sent orders never reached the exchange and can be resubmitted.")
+    print("=" * 30)
+
+    sys.exit(1 if submission.rejected or submission.unknown or submission.not_sent else 0)
+
 def main():
     # 1. Setup Logging (JSON to file)
     logger = setup_logging()
 
+    if sys.argv[1:2] == ["grid"]:
+        args = parse_grid_args(sys.argv[2:])
+        run_guarded(lambda: run_grid(args), args, logger)
+        return
+
     # 2. Parse Arguments
     parser = argparse.ArgumentParser(
         description="Binance Futures Testnet Trading Bot (USDT-M) v2",
+        epilog=(
+            "subcommands:\n"
+            "  grid    Place a ladder of LIMIT orders across a price range.\n"
+            "          Must be the first argument, see: python cli.py grid --help"
+        ),
         formatter_class=argparse.RawTextHelpFormatter
     )
 
@@ -27,57 +115,64 @@ def main():
 
     args = parser.parse_args()
 
+    run_guarded(lambda: run_single_order(args), args, logger)
+
+def run_single_order(args):
     # 3. Validation & Confirmation Loop
+    manager = OrderManager()
+    
+    # Basic pre-check before fetching metadata
+    if args.quantity <= 0:
+         print("Error: Quantity must be positive.")
+         sys.exit(1)
+
+    # 4. Print Summary
+    print("\nOrder Summary")
+    print("=" * 30)
+    print(f"Symbol:   {args.symbol}")
+    print(f"Side:     {args.side}")
+    print(f"Type:     {args.type}")
+    print(f"Quantity: {args.quantity}")
+    if args.type == "LIMIT":
+        if args.price is None:
+            print("Error: --price is required for LIMIT orders.")
+            sys.exit(1)
+        print(f"Price:    {args.price}")
+    print("-" * 30)
+
+    # 5. Confirmation
+    if not args.yes:
+        confirm = input("Confirm order? (y/n): ").strip().lower()
+        if confirm != 'y':
+            print("Order cancelled by user.")
+            sys.exit(0)
+
+    print("\nSending order to Binance Futures Testnet...")
+    
+    # 6. Execution
+    response = manager.place_order(
+        symbol=args.symbol,
+        side=args.side,
+        order_type=args.type,
+        quantity=args.quantity,
+        price=args.price
+    )
+    
+    # 7. Success Output
+    print("\nOrder Placed Successfully")
+    print("=" * 30)
+    print(f"Order ID:      {response.order_id}")
+    print(f"Status:        {response.status}")
+    print(f"Executed Qty:  {response.executed_qty}")
+    print(f"Avg Price:     {response.avg_price}")
+    print("=" * 30)
+    
+    sys.exit(0)
+
+def run_guarded(action, args, logger):
+    """Runs a CLI action, mapping bot exceptions to user-facing messages and exit codes."""
     try:
-        manager = OrderManager()
-        
-        # Basic pre-check before fetching metadata
-        if args.quantity <= 0:
-             print("Error: Quantity must be positive.")
-             sys.exit(1)
-
-        # 4. Print Summary
-        print("\nOrder Summary")
-        print("=" * 30)
-        print(f"Symbol:   {args.symbol}")
-        print(f"Side:     {args.side}")
-        print(f"Type:     {args.type}")
-        print(f"Quantity: {args.quantity}")
-        if args.type == "LIMIT":
-            if args.price is None:
-                print("Error: --price is required for LIMIT orders.")
-                sys.exit(1)
-            print(f"Price:    {args.price}")
-        print("-" * 30)
-
-        # 5. Confirmation
-        if not args.yes:
-            confirm = input("Confirm order? (y/n): ").strip().lower()
-            if confirm != 'y':
-                print("Order cancelled by user.")
-                sys.exit(0)
-
-        print("\nSending order to Binance Futures Testnet...")
-        
-        # 6. Execution
-        response = manager.place_order(
-            symbol=args.symbol,
-            side=args.side,
-            order_type=args.type,
-            quantity=args.quantity,
-            price=args.price
-        )
-        
-        # 7. Success Output
-        print("\nOrder Placed Successfully")
-        print("=" * 30)
-        print(f"Order ID:      {response.order_id}")
-        print(f"Status:        {response.status}")
-        print(f"Executed Qty:  {response.executed_qty}")
-        print(f"Avg Price:     {response.avg_price}")
-        print("=" * 30)
-        
-        sys.exit(0)
+        action()
 
     except ValidationError as e:
         print(f"\n[Validation Error] {e}")
@@ -0,0 +1,78 @@
+import pytest
+from binance.exceptions import BinanceAPIException
+from requests.exceptions import RequestException
+from bot.client import BinanceFuturesClient
+from bot.config import Config
+
+class FakeBinance:
+    """Stands in for python-binance; fails the chunks listed in `failures`."""
+
+    def __init__(self, failures=None):
+        self.failures = failures or {}
+        self.batches = []
+
+    def futures_place_batch_order(self, batchOrders):
+        index = len(self.batches)
+        self.batches.append(batchOrders)
+        if index in self.failures:
+            raise self.failures[index]
+        return [{"orderId": o["newClientOrderId"], "status": "NEW"} for o in batchOrders]
+
+def make_client(fake):
+    # Skip __init__: it connects and syncs time with the exchange
+    client = BinanceFuturesClient.__new__(BinanceFuturesClient)
+    client.client = fake
+    return client
+
+def make_orders(count):
+    return [{"symbol": "BTCUSDT", "newClientOrderId": f"id-{i}"} for i in range(count)]
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(Config, "RETRY_DELAY", 0)
+
+def test_create_batch_orders_chunks():
+    fake = FakeBinance()
+    results = make_client(fake).create_batch_orders(make_orders(12))
+
+    assert [len(b) for b in fake.batches] == [5, 5, 2]
+    assert [r["orderId"] for r in results] == [f"id-{i}" for i in range(12)]
+
+def test_create_batch_orders_api_error_rejects_only_its_chunk():
+    error = BinanceAPIException(None, 400, '{"code": -2019, "msg": "Margin is insufficient."}')
+    fake = FakeBinance(failures={1: error})
+    results = make_client(fake).create_batch_orders(make_orders(12))
+
+    assert len(fake.batches) == 3
+    assert all("orderId" in r for r in results[:5] + results[10:])
+    assert results[5:10] == [{"code": -2019, "msg": "Margin is insufficient."}] * 5
+
+def test_create_batch_orders_network_error_stops_remaining():
+    # Chunk 1 times out; it may have been placed, so it must not be re-sent
+    fake = FakeBinance(failures={1: RequestException("timeout")})
+    results = make_client(fake).create_batch_orders(make_orders(12))
+
+    assert len(fake.batches) == 2
+    assert all("orderId" in r for r in results[:5])
+    assert [r["status"] for r in results[5:10]] == ["UNKNOWN"] * 5
+    assert [r["status"] for r in results[10:]] == ["NOT_SENT"] * 2
+
+def test_create_batch_orders_server_error_stops_remaining():
+    error = BinanceAPIException(None, 503, '{"code": -1000, "msg": "Unknown error, execution status unknown."}')
+    fake = FakeBinance(failures={0: error})
+    results = make_client(fake).create_batch_orders(make_orders(12))
+
+    assert len(fake.batches) == 1
+    assert [r["status"] for r in results[:5]] == ["UNKNOWN"] * 5
+    assert [r["status"] for r in results[5:]] == ["NOT_SENT"] * 7
+
+def test_create_batch_orders_retries_when_not_executed(monkeypatch):
+    rate_limited = BinanceAPIException(None, 429, '{"code": -1003, "msg": "Too many requests."}')
+    timestamp = BinanceAPIException(None, 400, '{"code": -1021, "msg": "Timestamp outside recvWindow."}')
+    fake = FakeBinance(failures={0: rate_limited, 1: timestamp})
+    client = make_client(fake)
+    monkeypatch.setattr(client, "_sync_time", lambda: None)
+    results = client.create_batch_orders(make_orders(5))
+
+    assert len(fake.batches) == 3
+    assert [r["orderId"] for r in results] == [f"id-{i}" for i in range(5)]
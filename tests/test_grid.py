@@ -0,0 +1,71 @@
+import pytest
+from decimal import Decimal
+from bot.grid import build_grid
+from bot.precision import round_to_increment
+from bot.exceptions import ValidationError
+
+def test_round_to_increment():
+    # Non power-of-ten tick: 45000.3 with tick 0.5 -> 45000.5
+    assert round_to_increment(Decimal("45000.3"), Decimal("0.5"), "ROUND_HALF_UP") == Decimal("45000.5")
+    # Step rounds down: 0.0025 with step 0.001 -> 0.002
+    assert round_to_increment(Decimal("0.0025"), Decimal("0.001")) == Decimal("0.002")
+
+def test_build_grid_arithmetic():
+    plan = build_grid("BTCUSDT", "SELL", Decimal("100"), Decimal("104"), 5, Decimal("1"),
+                      tick_size=Decimal("0.1"), step_size=Decimal("0.001"))
+    assert [l.price for l in plan.levels] == [Decimal(p) for p in ("100", "101", "102", "103", "104")]
+    assert plan.allocated_qty == Decimal("1")
+    assert plan.levels[0].to_params("BTCUSDT", "SELL")["price"] == "100"
+
+def test_build_grid_geometric():
+    plan = build_grid("BTCUSDT", "SELL", Decimal("100"), Decimal("400"), 3, Decimal("0.3"),
+                      tick_size=Decimal("0.01"), step_size=Decimal("0.001"), spacing="GEOMETRIC")
+    assert [l.price for l in plan.levels] == [Decimal("100"), Decimal("200"), Decimal("400")]
+
+def test_build_grid_remainder_goes_nearest_market():
+    # 10 steps over 3 levels -> 4/3/3, extra step on the highest BUY level
+    plan = build_grid("BTCUSDT", "BUY", Decimal("100"), Decimal("102"), 3, Decimal("0.0105"),
+                      tick_size=Decimal("0.1"), step_size=Decimal("0.001"))
+    assert [l.price for l in plan.levels] == [Decimal("102"), Decimal("101"), Decimal("100")]
+    assert [l.quantity for l in plan.levels] == [Decimal("0.004"), Decimal("0.003"), Decimal("0.003")]
+    assert plan.unallocated_qty == Decimal("0.0005")
+
+def test_build_grid_dedupes_collapsed_levels():
+    # 11 levels over a 1-tick range collapse to 2 prices
+    plan = build_grid("BTCUSDT", "SELL", Decimal("100"), Decimal("100.1"), 11, Decimal("1"),
+                      tick_size=Decimal("0.1"), step_size=Decimal("0.001"))
+    assert [l.price for l in plan.levels] == [Decimal("100"), Decimal("100.1")]
+    assert plan.collapsed_levels == 9
+    assert plan.allocated_qty == Decimal("1")
+
+def test_build_grid_invalid():
+    with pytest.raises(ValidationError):
+        build_grid("BTCUSDT", "BUY", Decimal("104"), Decimal("100"), 5, Decimal("1"), Decimal("0.1"), Decimal("0.001"))
+    with pytest.raises(ValidationError):
+        build_grid("BTCUSDT", "BUY", Decimal("100"), Decimal("104"), 5, Decimal("1"), Decimal("0.1"), Decimal("0.001"), spacing="LOG")
+    # Below minimum quantity per level
+    with pytest.raises(ValidationError):
+        build_grid("BTCUSDT", "BUY", Decimal("100"), Decimal("104"), 5, Decimal("0.004"),
+                   Decimal("0.1"), Decimal("0.001"), min_qty=Decimal("0.001"))
+
+def test_build_grid_stays_within_bounds():
+    # Bounds off the tick round inward: 1003 -> 1010, 1047 -> 1040
+    plan = build_grid("BTCUSDT", "SELL", Decimal("1003"), Decimal("1047"), 5, Decimal("1"),
+                      tick_size=Decimal("10"), step_size=Decimal("0.001"))
+    prices = [l.price for l in plan.levels]
+    assert prices[0] == Decimal("1010") and prices[-1] == Decimal("1040")
+    assert all(Decimal("1003") <= p <= Decimal("1047") for p in prices)
+
+def test_build_grid_rejects_single_level():
+    # Narrower than one tick collapses to one order
+    with pytest.raises(ValidationError):
+        build_grid("BTCUSDT", "BUY", Decimal("100"), Decimal("100.01"), 5, Decimal("1"),
+                   tick_size=Decimal("0.1"), step_size=Decimal("0.001"))
+    # Only 1010 fits inside 1005 - 1015 (previously a 1020 level escaped the range)
+    with pytest.raises(ValidationError):
+        build_grid("BTCUSDT", "SELL", Decimal("1005"), Decimal("1015"), 3, Decimal("1"),
+                   tick_size=Decimal("10"), step_size=Decimal("0.001"))
+    # No tick at all inside the range
+    with pytest.raises(ValidationError):
+        build_grid("BTCUSDT", "BUY", Decimal("1001"), Decimal("1009"), 5, Decimal("1"),
+                   tick_size=Decimal("10"), step_size=Decimal("0.001"))
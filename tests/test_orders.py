@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+from bot.orders import OrderManager
+from bot.exceptions import ValidationError
+
+EXCHANGE_INFO = {
+    "symbols": [{
+        "symbol": "BTCUSDT",
+        "status": "TRADING",
+        "baseAsset": "BTC",
+        "quoteAsset": "USDT",
+        "filters": [
+            {"filterType": "PRICE_FILTER", "tickSize": "0.50"},
+            {"filterType": "LOT_SIZE", "stepSize": "0.010", "minQty": "0.020"},
+            {"filterType": "MIN_NOTIONAL", "notional": "2"}
+        ]
+    }]
+}
+
+class StubClient:
+    """Fake BinanceFuturesClient returning canned batch results."""
+
+    def __init__(self, results=None):
+        self.results = results
+        self.exchange_info_calls = 0
+        self.sent = None
+
+    def get_exchange_info(self):
+        self.exchange_info_calls += 1
+        return EXCHANGE_INFO
+
+    def create_batch_orders(self, params_list):
+        self.sent = params_list
+        return self.results
+
+def test_plan_grid_uses_symbol_filters():
+    plan = OrderManager(client=StubClient()).plan_grid("BTCUSDT", "SELL", 100.2, 101.8, 5, 0.085)
+
+    # tickSize 0.5: 100.2 -> 100.5, 101.8 -> 101.5
+    assert [l.price for l in plan.levels] == [Decimal("100.5"), Decimal("101"), Decimal("101.5")]
+    # stepSize 0.01: 8 steps over 3 levels
+    assert [l.quantity for l in plan.levels] == [Decimal("0.03"), Decimal("0.03"), Decimal("0.02")]
+
+    # minQty 0.02: 3 levels of 0.01 is too small
+    with pytest.raises(ValidationError):
+        OrderManager(client=StubClient()).plan_grid("BTCUSDT", "SELL", 100, 101, 3, 0.03)
+
+    # notional 2: 90 x 0.02 = 1.8 is too small
+    with pytest.raises(ValidationError):
+        OrderManager(client=StubClient()).plan_grid("BTCUSDT", "SELL", 90, 91, 2, 0.04)
+
+def test_plan_grid_prechecks_before_fetching_metadata():
+    client = StubClient()
+    with pytest.raises(ValidationError):
+        OrderManager(client=client).plan_grid("BTCUSDT", "BUY", 101, 100, 5, 1)
+    with pytest.raises(ValidationError):
+        OrderManager(client=client).plan_grid("BTCUSDT", "BUY", 100, 101, 1, 1)
+    assert client.exchange_info_calls == 0
+
+def test_place_grid_splits_results():
+    client = StubClient(results=[
+        {"orderId": 1, "symbol": "BTCUSDT", "side": "SELL", "type": "LIMIT", "origQty": "0.03", "status": "NEW"},
+        {"code": -2019, "msg": "Margin is insufficient."},
+        {"status": "UNKNOWN", "code": None, "msg": "Status unknown: timeout"}
+    ])
+    manager = OrderManager(client=client)
+    submission = manager.place_grid(manager.plan_grid("BTCUSDT", "SELL", 100.2, 101.8, 5, 0.085))
+
+    assert [r.order_id for r in submission.accepted] == [1]
+    assert submission.accepted[0].orig_qty == Decimal("0.03")
+
+    assert len(submission.rejected) == 1
+    assert submission.rejected[0]["price"] == "101"
+    assert submission.rejected[0]["quantity"] == "0.03"
+    assert submission.rejected[0]["code"] == -2019
+
+    assert len(submission.unknown) == 1
+    assert submission.unknown[0]["price"] == "101.5"
+    assert submission.unknown[0]["quantity"] == "0.02"
+    # Client ids are sent with the orders so unknown ones can be reconciled
+    assert submission.unknown[0]["client_order_id"] == client.sent[2]["newClientOrderId"]
+    assert len({p["newClientOrderId"] for p in client.sent}) == 3
+
+def test_place_grid_not_sent_and_duplicates():
+    client = StubClient(results=[
+        {"code": -4116, "msg": "ClientOrderId is duplicated."},
+        {"status": "NOT_SENT", "code": None, "msg": "Not sent: timeout"}
+    ])
+    manager = OrderManager(client=client)
+    submission = manager.place_grid(manager.plan_grid("BTCUSDT", "SELL", 100.2, 101.8, 5, 0.085))
+
+    # Duplicate id means an earlier attempt was placed; the missing third result is unknown too
+    assert [u["price"] for u in submission.unknown] == ["100.5", "101.5"]
+    assert [n["price"] for n in submission.not_sent] == ["101"]
+    assert submission.rejected == []